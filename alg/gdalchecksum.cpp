@@ -40,6 +40,113 @@
 #include "gdal.h"
 #include "gdal_priv.h"
 
+// Restrict to 64bit processors because they are guaranteed to have SSE2
+#if defined(__x86_64) || defined(_M_X64)
+#define USE_SSE2
+#include <emmintrin.h>
+#endif
+
+static constexpr int anPrimes[11] = {7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43};
+
+#ifdef USE_SSE2
+
+namespace
+{
+// The primes, and the magic numbers to divide by them, repeated so that
+// 16 * 11 consecutive entries can be read from any starting index in the
+// [0, 10] range.
+struct ChecksumPrimeTables
+{
+    GUInt16 anPrime[11 + 16 * 11];
+    GUInt16 anMagic[11 + 16 * 11];
+};
+
+constexpr ChecksumPrimeTables BuildChecksumPrimeTables()
+{
+    ChecksumPrimeTables sTables{};
+    for (int i = 0; i < 11 + 16 * 11; ++i)
+    {
+        const int nPrime = anPrimes[i % 11];
+        sTables.anPrime[i] = static_cast<GUInt16>(nPrime);
+        sTables.anMagic[i] =
+            static_cast<GUInt16>((65536 + nPrime - 1) / nPrime);
+    }
+    return sTables;
+}
+
+constexpr ChecksumPrimeTables sChecksumPrimeTables = BuildChecksumPrimeTables();
+}  // namespace
+
+#endif
+
+/************************************************************************/
+/*                         ChecksumByteBuffer()                         */
+/************************************************************************/
+
+// Returns the contribution of nCount Byte values to the checksum (modulo
+// 65536), the first value being taken modulo anPrimes[iPrime].
+static int ChecksumByteBuffer(const GByte *pabyData, size_t nCount, int iPrime)
+{
+    size_t i = 0;
+    GUInt32 nSum = 0;
+#ifdef USE_SSE2
+    // 16 bytes per load, times the 11 primes, so that each iteration
+    // starts again with the same prime.
+    constexpr size_t VALS_PER_ITER = 16 * 11;
+    if (nCount >= VALS_PER_ITER)
+    {
+        // For 0 <= x <= 255, x / p == (x * ceil(65536 / p)) >> 16 for all
+        // our primes, hence the modulo can be done with 16-bit multiplications.
+        __m128i anPrimeVec[2 * 11];
+        __m128i anMagicVec[2 * 11];
+        for (int k = 0; k < 2 * 11; ++k)
+        {
+            anPrimeVec[k] = _mm_loadu_si128(reinterpret_cast<const __m128i *>(
+                sChecksumPrimeTables.anPrime + iPrime + 8 * k));
+            anMagicVec[k] = _mm_loadu_si128(reinterpret_cast<const __m128i *>(
+                sChecksumPrimeTables.anMagic + iPrime + 8 * k));
+        }
+
+        const __m128i zero = _mm_setzero_si128();
+        // 16-bit accumulators wrap modulo 65536, which is what the checksum
+        // is reduced to anyway.
+        __m128i acc = zero;
+        for (; i + VALS_PER_ITER <= nCount; i += VALS_PER_ITER)
+        {
+            for (int k = 0; k < 11; ++k)
+            {
+                const __m128i v = _mm_loadu_si128(
+                    reinterpret_cast<const __m128i *>(pabyData + i + 16 * k));
+                const __m128i lo = _mm_unpacklo_epi8(v, zero);
+                const __m128i hi = _mm_unpackhi_epi8(v, zero);
+                const __m128i lo_div = _mm_mulhi_epu16(lo, anMagicVec[2 * k]);
+                const __m128i hi_div =
+                    _mm_mulhi_epu16(hi, anMagicVec[2 * k + 1]);
+                acc = _mm_add_epi16(
+                    acc, _mm_sub_epi16(
+                             lo, _mm_mullo_epi16(lo_div, anPrimeVec[2 * k])));
+                acc = _mm_add_epi16(
+                    acc, _mm_sub_epi16(hi, _mm_mullo_epi16(
+                                               hi_div, anPrimeVec[2 * k + 1])));
+            }
+        }
+
+        GUInt16 anAcc[8];
+        _mm_storeu_si128(reinterpret_cast<__m128i *>(anAcc), acc);
+        for (int j = 0; j < 8; ++j)
+            nSum += anAcc[j];
+        // VALS_PER_ITER being a multiple of 11, iPrime is unchanged.
+    }
+#endif
+    for (; i < nCount; ++i)
+    {
+        nSum += pabyData[i] % anPrimes[iPrime++];
+        if (iPrime > 10)
+            iPrime = 0;
+    }
+    return static_cast<int>(nSum & 0xffff);
+}
+
 /************************************************************************/
 /*                         GDALChecksumImage()                          */
 /************************************************************************/
@@ -67,8 +174,6 @@ int CPL_STDCALL GDALChecksumImage(GDALRasterBandH hBand, int nXOff, int nYOff,
 {
     VALIDATE_POINTER1(hBand, "GDALChecksumImage", 0);
 
-    const static int anPrimes[11] = {7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43};
-
     int nChecksum = 0;
     int iPrime = 0;
     const GDALDataType eDataType = GDALGetRasterDataType(hBand);
@@ -239,7 +344,11 @@ int CPL_STDCALL GDALChecksumImage(GDALRasterBandH hBand, int nXOff, int nYOff,
     }
     else if (nXOff == 0 && nYOff == 0)
     {
-        const GDALDataType eDstDataType = bComplex ? GDT_CInt32 : GDT_Int32;
+        // Byte data is read as such, as it benefits from a SSE2 code path
+        const bool bByte = eDataType == GDT_Byte;
+        const GDALDataType eDstDataType = bByte      ? GDT_Byte
+                                          : bComplex ? GDT_CInt32
+                                                     : GDT_Int32;
         int nBlockXSize = 0;
         int nBlockYSize = 0;
         GDALGetBlockSize(hBand, &nBlockXSize, &nBlockYSize);
@@ -272,12 +381,14 @@ int CPL_STDCALL GDALChecksumImage(GDALRasterBandH hBand, int nXOff, int nYOff,
             }
         }
 
-        int *panChunkData = static_cast<GInt32 *>(
-            VSI_MALLOC3_VERBOSE(nChunkXSize, nChunkYSize, nDstDataTypeSize));
-        if (panChunkData == nullptr)
+        void *pChunkData =
+            VSI_MALLOC3_VERBOSE(nChunkXSize, nChunkYSize, nDstDataTypeSize);
+        if (pChunkData == nullptr)
         {
             return -1;
         }
+        const GByte *pabyChunkData = static_cast<const GByte *>(pChunkData);
+        const int *panChunkData = static_cast<const GInt32 *>(pChunkData);
         const int nValsPerIter = bComplex ? 2 : 1;
 
         const int nYBlocks = DIV_ROUND_UP(nYSize, nChunkYSize);
@@ -296,7 +407,7 @@ int CPL_STDCALL GDALChecksumImage(GDALRasterBandH hBand, int nXOff, int nYOff,
                 const int nChunkActualXSize = iXEnd - iXStart;
                 if (GDALRasterIO(
                         hBand, GF_Read, iXStart, iYStart, nChunkActualXSize,
-                        nChunkActualHeight, panChunkData, nChunkActualXSize,
+                        nChunkActualHeight, pChunkData, nChunkActualXSize,
                         nChunkActualHeight, eDstDataType, 0, 0) != CE_None)
                 {
                     CPLError(CE_Failure, CPLE_FileIO,
@@ -318,19 +429,27 @@ int CPL_STDCALL GDALChecksumImage(GDALRasterBandH hBand, int nXOff, int nYOff,
                     const size_t nOffset = nValsPerIter *
                                            static_cast<size_t>(iY - iYStart) *
                                            nChunkActualXSize;
-                    for (size_t i = 0; i < xIters; ++i)
+                    if (bByte)
                     {
-                        nChecksum +=
-                            panChunkData[nOffset + i] % anPrimes[iPrime++];
-                        if (iPrime > 10)
-                            iPrime = 0;
+                        nChecksum += ChecksumByteBuffer(pabyChunkData + nOffset,
+                                                        xIters, iPrime);
+                    }
+                    else
+                    {
+                        for (size_t i = 0; i < xIters; ++i)
+                        {
+                            nChecksum +=
+                                panChunkData[nOffset + i] % anPrimes[iPrime++];
+                            if (iPrime > 10)
+                                iPrime = 0;
+                        }
                     }
                     nChecksum &= 0xffff;
                 }
             }
         }
 
-        CPLFree(panChunkData);
+        CPLFree(pChunkData);
     }
     else
     {
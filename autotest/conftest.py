@@ -281,6 +281,13 @@ def pytest_addoption(parser):
     except ImportError:
         parser.addoption("--dist")
 
+    parser.addoption(
+        "--perf-class-report",
+        metavar="FILENAME",
+        help="write a CSV file with the duration of the tests marked with "
+        "@pytest.mark.perf_class()",
+    )
+
 
 def pytest_configure(config):
     test_version = config.getini("gdal_version")
@@ -293,6 +300,39 @@ def pytest_configure(config):
         )
 
 
+perf_class_records = []
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    if report.when == "call" and item.config.getoption("perf_class_report"):
+        mark = item.get_closest_marker("perf_class")
+        if mark:
+            perf_class_records.append(
+                (item.nodeid, mark.args[0], "%.3f" % (report.duration * 1000))
+            )
+
+
+def pytest_sessionfinish(session):
+    filename = session.config.getoption("perf_class_report")
+    if not filename or not perf_class_records:
+        return
+
+    # Each pytest-xdist worker writes its own file
+    workerinput = getattr(session.config, "workerinput", None)
+    if workerinput:
+        filename += "." + workerinput["workerid"]
+
+    import csv
+
+    with open(filename, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(("test_id", "class", "wall_ms"))
+        writer.writerows(perf_class_records)
+
+
 def list_loaded_dlls():
     try:
         import psutil
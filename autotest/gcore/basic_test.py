@@ -950,6 +950,33 @@ def test_checksum_more_than_2billion_pixels():
     gdal.Unlink(filename)
 
 
+###############################################################################
+# Test that the Byte (SSE2) and Int32 code paths of GDALChecksumImage() are
+# consistent
+
+
+def test_checksum_byte_consistent_with_uint16():
+
+    width = 1000
+    height = 10
+    data = bytes([(i * 7 + i // 13) % 256 for i in range(width * height)])
+
+    ds_byte = gdal.GetDriverByName("MEM").Create("", width, height)
+    ds_byte.GetRasterBand(1).WriteRaster(0, 0, width, height, data)
+
+    ds_uint16 = gdal.GetDriverByName("MEM").Create(
+        "", width, height, 1, gdal.GDT_UInt16
+    )
+    ds_uint16.GetRasterBand(1).WriteRaster(
+        0, 0, width, height, data, buf_type=gdal.GDT_Byte
+    )
+
+    assert ds_byte.GetRasterBand(1).Checksum() == ds_uint16.GetRasterBand(1).Checksum()
+    assert ds_byte.GetRasterBand(1).Checksum(
+        1, 1, width - 1, height - 1
+    ) == ds_uint16.GetRasterBand(1).Checksum(1, 1, width - 1, height - 1)
+
+
 def test_tmp_vsimem(tmp_vsimem):
     assert isinstance(tmp_vsimem, os.PathLike)
 
@@ -29,7 +29,6 @@
 # DEALINGS IN THE SOFTWARE.
 ###############################################################################
 
-import os
 import struct
 
 import gdaltest
@@ -46,16 +45,36 @@ def module_disable_exceptions():
 
 
 ###############################################################################
-# Verify the checksum and flags for "all valid" case.
+# GTiff driver, used by most of the tests
 
 
-def test_mask_1():
+@pytest.fixture(scope="module")
+def gtiff_drv():
+
+    return gdal.GetDriverByName("GTiff")
+
+
+###############################################################################
+# Read-only dataset shared by the tests that only read it, or use it as the
+# source of a CreateCopy()
 
-    ds = gdal.Open("data/byte.tif")
 
+@pytest.fixture(scope="module")
+def byte_tif_ds():
+
+    ds = gdal.Open("data/byte.tif")
     assert ds is not None, "Failed to open test dataset."
+    return ds
 
-    band = ds.GetRasterBand(1)
+
+###############################################################################
+# Verify the checksum and flags for "all valid" case.
+
+
+@pytest.mark.perf_class("compute")
+def test_mask_1(byte_tif_ds):
+
+    band = byte_tif_ds.GetRasterBand(1)
     assert not band.IsMaskBand()
 
     assert band.GetMaskFlags() == gdal.GMF_ALL_VALID, "Did not get expected mask."
@@ -63,6 +82,7 @@ def test_mask_1():
 
     cs = band.GetMaskBand().Checksum()
     assert cs == 4873, "Got wrong mask checksum"
+    assert gdaltest.byte_checksum(band.GetMaskBand().ReadRaster()) == cs
 
     my_min, my_max, mean, stddev = band.GetMaskBand().ComputeStatistics(0)
     assert (my_min, my_max, mean, stddev) == (255, 255, 255, 0), "Got wrong mask stats"
@@ -72,6 +92,7 @@ def test_mask_1():
 # Verify the checksum and flags for "nodata" case.
 
 
+@pytest.mark.perf_class("compute")
 def test_mask_2():
 
     ds = gdal.Open("data/byte.vrt")
@@ -86,12 +107,14 @@ def test_mask_2():
 
     cs = band.GetMaskBand().Checksum()
     assert cs == 4209, "Got wrong mask checksum"
+    assert gdaltest.byte_checksum(band.GetMaskBand().ReadRaster()) == cs
 
 
 ###############################################################################
 # Verify the checksum and flags for "alpha" case.
 
 
+@pytest.mark.perf_class("compute")
 @pytest.mark.require_driver("PNG")
 def test_mask_3():
 
@@ -110,6 +133,7 @@ def test_mask_3():
 
     cs = band.GetMaskBand().Checksum()
     assert cs == 10807, "Got wrong mask checksum"
+    assert gdaltest.byte_checksum(band.GetMaskBand().ReadRaster()) == cs
 
     # Verify second and third same as first.
 
@@ -132,6 +156,7 @@ def test_mask_3():
 
     cs = band.GetMaskBand().Checksum()
     assert cs == 36074, "Got wrong alpha mask checksum"
+    assert gdaltest.byte_checksum(band.GetMaskBand().ReadRaster()) == cs
 
 
 ###############################################################################
@@ -140,13 +165,13 @@ def test_mask_3():
 
 @pytest.mark.require_driver("JPEG")
 @pytest.mark.require_driver("PNM")
-def test_mask_4(tmp_path):
+def test_mask_4(tmp_vsimem):
 
     src_ds = gdal.Open("../gdrivers/data/jpeg/masked.jpg")
 
     assert src_ds is not None, "Failed to open test dataset."
 
-    output_ppm = str(tmp_path / "mask_4.ppm")
+    output_ppm = str(tmp_vsimem / "mask_4.ppm")
 
     # NOTE: for now we copy to PNM since it does everything (overviews too)
     # externally. Should eventually test with gtiff, hfa.
@@ -172,22 +197,26 @@ def test_mask_4(tmp_path):
 
 
 ###############################################################################
-# Create overviews for masked file, and verify the overviews have proper
-# masks built for them.
+# Copy of a *real* masked dataset to PNM, on which overviews are built once
+# for both test_mask_5_buildoverviews and test_mask_5_reopen_persistence.
+# Yields the file name and, for the second overview, its mask flags, whether
+# its mask band is a mask band and its checksum, as got from the dataset on
+# which the overviews have been built.
 
 
-@pytest.mark.require_driver("JPEG")
-@pytest.mark.require_driver("PNM")
-def test_mask_5(tmp_path):
+@pytest.fixture(scope="module")
+def mask_5_ppm():
 
     src_ds = gdal.Open("../gdrivers/data/jpeg/masked.jpg")
+    assert src_ds is not None, "Failed to open test dataset."
 
-    output_ppm = str(tmp_path / "mask_4.ppm")
+    output_ppm = "/vsimem/mask_5.ppm"
     drv = gdal.GetDriverByName("PNM")
     ds = drv.CreateCopy(output_ppm, src_ds)
+    assert ds is not None
+    ds = None
 
     ds = gdal.Open(output_ppm, gdal.GA_Update)
-
     assert ds is not None, "Failed to open test dataset."
 
     # So that we instantiate the mask band before.
@@ -195,23 +224,52 @@ def test_mask_5(tmp_path):
 
     ds.BuildOverviews(overviewlist=[2, 4])
 
-    # confirm mask flags on overview.
     ovr = ds.GetRasterBand(1).GetOverview(1)
+    msk = ovr.GetMaskBand()
+    ovr_mask = (ovr.GetMaskFlags(), msk.IsMaskBand(), msk.Checksum())
+    ovr = None
+    msk = None
+    ds = None
 
-    assert ovr.GetMaskFlags() == gdal.GMF_PER_DATASET, "did not get expected mask flags"
+    yield output_ppm, ovr_mask
 
-    msk = ovr.GetMaskBand()
-    assert msk.IsMaskBand()
-    cs = msk.Checksum()
+    drv.Delete(output_ppm)
+
+
+###############################################################################
+# Create overviews for masked file, and verify the overviews have proper
+# masks built for them.
+
+
+@pytest.mark.perf_class("memory")
+@pytest.mark.require_driver("JPEG")
+@pytest.mark.require_driver("PNM")
+@pytest.mark.xdist_group("mask_5")
+def test_mask_5_buildoverviews(mask_5_ppm):
+
+    _, (mask_flags, is_mask_band, cs) = mask_5_ppm
+
+    # confirm mask flags on overview.
+    assert mask_flags == gdal.GMF_PER_DATASET, "did not get expected mask flags"
+
+    assert is_mask_band
     expected_cs = 20505
 
     assert cs == expected_cs, "Did not get expected checksum"
-    ovr = None
-    msk = None
-    ds = None
 
-    # Reopen and confirm we still get same results.
-    ds = gdal.Open(output_ppm)
+
+###############################################################################
+# Reopen the file on which overviews have been built and confirm we still get
+# same results.
+
+
+@pytest.mark.perf_class("memory")
+@pytest.mark.require_driver("JPEG")
+@pytest.mark.require_driver("PNM")
+@pytest.mark.xdist_group("mask_5")
+def test_mask_5_reopen_persistence(mask_5_ppm):
+
+    ds = gdal.Open(mask_5_ppm[0])
 
     # confirm mask flags on overview.
     ovr = ds.GetRasterBand(1).GetOverview(1)
@@ -420,15 +478,10 @@ def test_mask_12():
 # Test creation of external TIFF mask band
 
 
-def test_mask_13():
-
-    src_ds = gdal.Open("data/byte.tif")
+@pytest.mark.perf_class("io")
+def test_mask_13(byte_tif_ds, gtiff_drv):
 
-    assert src_ds is not None, "Failed to open test dataset."
-
-    drv = gdal.GetDriverByName("GTiff")
-    ds = drv.CreateCopy("tmp/byte_with_mask.tif", src_ds)
-    src_ds = None
+    ds = gtiff_drv.CreateCopy("/vsimem/byte_with_mask.tif", byte_tif_ds)
 
     with gdal.config_option("GDAL_TIFF_INTERNAL_MASK", "NO"):
         ds.CreateMaskBand(gdal.GMF_PER_DATASET)
@@ -444,12 +497,9 @@ def test_mask_13():
 
     ds = None
 
-    try:
-        os.stat("tmp/byte_with_mask.tif.msk")
-    except OSError:
-        pytest.fail("tmp/byte_with_mask.tif.msk is absent")
+    assert gdal.VSIStatL("/vsimem/byte_with_mask.tif.msk") is not None
 
-    ds = gdal.Open("tmp/byte_with_mask.tif")
+    ds = gdal.Open("/vsimem/byte_with_mask.tif")
 
     assert (
         ds.GetRasterBand(1).GetMaskFlags() == gdal.GMF_PER_DATASET
@@ -460,27 +510,22 @@ def test_mask_13():
 
     ds = None
 
-    drv.Delete("tmp/byte_with_mask.tif")
+    gtiff_drv.Delete("/vsimem/byte_with_mask.tif")
 
-    assert not os.path.exists("tmp/byte_with_mask.tif.msk")
+    assert gdal.VSIStatL("/vsimem/byte_with_mask.tif.msk") is None
 
 
 ###############################################################################
 # Test creation of internal TIFF mask band
 
 
+@pytest.mark.perf_class("io")
 @pytest.mark.require_creation_option("GTiff", "JPEG")
-def test_mask_14():
-
-    src_ds = gdal.Open("data/byte.tif")
-
-    assert src_ds is not None, "Failed to open test dataset."
+def test_mask_14(byte_tif_ds, gtiff_drv):
 
-    drv = gdal.GetDriverByName("GTiff")
     with gdal.config_option("GDAL_TIFF_INTERNAL_MASK", "NO"):
         with gdal.config_option("GDAL_TIFF_INTERNAL_MASK_TO_8BIT", "FALSE"):
-            ds = drv.CreateCopy("tmp/byte_with_mask.tif", src_ds)
-    src_ds = None
+            ds = gtiff_drv.CreateCopy("/vsimem/byte_with_mask.tif", byte_tif_ds)
 
     # The only flag value supported for internal mask is GMF_PER_DATASET
     with gdal.quiet_errors():
@@ -511,10 +556,10 @@ def test_mask_14():
 
     ds = None
 
-    assert not os.path.exists("tmp/byte_with_mask.tif.msk")
+    assert gdal.VSIStatL("/vsimem/byte_with_mask.tif.msk") is None
 
     with gdaltest.config_option("GDAL_TIFF_INTERNAL_MASK_TO_8BIT", "FALSE"):
-        ds = gdal.Open("tmp/byte_with_mask.tif")
+        ds = gdal.Open("/vsimem/byte_with_mask.tif")
 
         assert (
             ds.GetRasterBand(1).GetMaskFlags() == gdal.GMF_PER_DATASET
@@ -525,34 +570,32 @@ def test_mask_14():
 
     # Test fix for #5884
     with gdaltest.SetCacheMax(0):
-        out_ds = drv.CreateCopy(
-            "/vsimem/byte_with_mask.tif", ds, options=["COMPRESS=JPEG"]
+        out_ds = gtiff_drv.CreateCopy(
+            "/vsimem/byte_with_mask_jpeg.tif", ds, options=["COMPRESS=JPEG"]
         )
 
     assert out_ds.GetRasterBand(1).Checksum() != 0
     cs = ds.GetRasterBand(1).GetMaskBand().Checksum()
     assert cs == 400, "Got wrong checksum for the mask (4)"
     out_ds = None
-    drv.Delete("/vsimem/byte_with_mask.tif")
+    gtiff_drv.Delete("/vsimem/byte_with_mask_jpeg.tif")
 
     ds = None
 
-    drv.Delete("tmp/byte_with_mask.tif")
+    gtiff_drv.Delete("/vsimem/byte_with_mask.tif")
 
 
 ###############################################################################
 # Test creation of internal TIFF overview, mask band and mask band of overview
 
 
-def mask_and_ovr(order, method):
-
-    src_ds = gdal.Open("data/byte.tif")
+@pytest.mark.perf_class("memory")
+@pytest.mark.parametrize("method", ["NEAREST", "AVERAGE"])
+@pytest.mark.parametrize("order", [1, 2, 3, 4])
+def test_mask_and_ovr(tmp_vsimem, byte_tif_ds, gtiff_drv, order, method):
 
-    assert src_ds is not None, "Failed to open test dataset."
-
-    drv = gdal.GetDriverByName("GTiff")
-    ds = drv.CreateCopy("tmp/byte_with_ovr_and_mask.tif", src_ds)
-    src_ds = None
+    filename = str(tmp_vsimem / "byte_with_ovr_and_mask.tif")
+    ds = gtiff_drv.CreateCopy(filename, byte_tif_ds)
 
     if order == 1:
         ds.CreateMaskBand(gdal.GMF_PER_DATASET)
@@ -577,17 +620,17 @@ def mask_and_ovr(order, method):
 
     if order < 4:
         ds = None
-        ds = gdal.Open("tmp/byte_with_ovr_and_mask.tif", gdal.GA_Update)
+        ds = gdal.Open(filename, gdal.GA_Update)
         ds.GetRasterBand(1).GetMaskBand().Fill(1)
         # The overview of the mask will be implicitly recomputed.
         ds.BuildOverviews(method, overviewlist=[2, 4])
 
     ds = None
 
-    assert not os.path.exists("tmp/byte_with_ovr_and_mask.tif.msk")
+    assert gdal.VSIStatL(filename + ".msk") is None
 
     with gdaltest.config_option("GDAL_TIFF_INTERNAL_MASK_TO_8BIT", "FALSE"):
-        ds = gdal.Open("tmp/byte_with_ovr_and_mask.tif")
+        ds = gdal.Open(filename)
 
         assert (
             ds.GetRasterBand(1).GetMaskFlags() == gdal.GMF_PER_DATASET
@@ -604,39 +647,7 @@ def mask_and_ovr(order, method):
 
     ds = None
 
-    drv.Delete("tmp/byte_with_ovr_and_mask.tif")
-
-
-def test_mask_15():
-    return mask_and_ovr(1, "NEAREST")
-
-
-def test_mask_16():
-    return mask_and_ovr(2, "NEAREST")
-
-
-def test_mask_17():
-    return mask_and_ovr(3, "NEAREST")
-
-
-def test_mask_18():
-    return mask_and_ovr(4, "NEAREST")
-
-
-def test_mask_15_avg():
-    return mask_and_ovr(1, "AVERAGE")
-
-
-def test_mask_16_avg():
-    return mask_and_ovr(2, "AVERAGE")
-
-
-def test_mask_17_avg():
-    return mask_and_ovr(3, "AVERAGE")
-
-
-def test_mask_18_avg():
-    return mask_and_ovr(4, "AVERAGE")
+    gtiff_drv.Delete(filename)
 
 
 ###############################################################################
@@ -658,6 +669,7 @@ def test_mask_19():
     expected_cs = 11043
 
     assert cs == expected_cs, "Did not get expected checksum"
+    assert gdaltest.byte_checksum(msk.ReadRaster()) == cs
 
     msk = None
     ds = None
@@ -667,100 +679,87 @@ def test_mask_19():
 # Extensive test of nodata mask for all data types
 
 
-def test_mask_20():
+nodata_types_and_values = [
+    (gdal.GDT_Byte, 1),
+    (gdal.GDT_Int16, -1),
+    (gdal.GDT_UInt16, 1),
+    (gdal.GDT_Int32, -1),
+    (gdal.GDT_UInt32, 1),
+    (gdal.GDT_Float32, 0.5),
+    (gdal.GDT_Float64, 0.5),
+    (gdal.GDT_CFloat32, 0.5),
+    (gdal.GDT_CFloat64, 0.5),
+]
 
-    types = [
-        gdal.GDT_Byte,
-        gdal.GDT_Int16,
-        gdal.GDT_UInt16,
-        gdal.GDT_Int32,
-        gdal.GDT_UInt32,
-        gdal.GDT_Float32,
-        gdal.GDT_Float64,
-        gdal.GDT_CFloat32,
-        gdal.GDT_CFloat64,
-    ]
 
-    nodatavalue = [1, -1, 1, -1, 1, 0.5, 0.5, 0.5, 0.5]
+@pytest.mark.perf_class("io")
+@pytest.mark.parametrize(
+    "typ,nodatavalue",
+    nodata_types_and_values,
+    ids=[gdal.GetDataTypeName(typ) for typ, _ in nodata_types_and_values],
+)
+def test_mask_20(tmp_vsimem, gtiff_drv, typ, nodatavalue):
 
-    drv = gdal.GetDriverByName("GTiff")
-    for i, typ in enumerate(types):
-        ds = drv.Create("tmp/mask20.tif", 1, 1, 1, typ)
-        ds.GetRasterBand(1).Fill(nodatavalue[i])
-        ds.GetRasterBand(1).SetNoDataValue(nodatavalue[i])
+    filename = str(tmp_vsimem / "mask20.tif")
 
-        assert (
-            ds.GetRasterBand(1).GetMaskFlags() == gdal.GMF_NODATA
-        ), "did not get expected mask flags for type %s" % gdal.GetDataTypeName(typ)
+    ds = gtiff_drv.Create(filename, 1, 1, 1, typ)
+    ds.GetRasterBand(1).Fill(nodatavalue)
+    ds.GetRasterBand(1).SetNoDataValue(nodatavalue)
 
-        msk = ds.GetRasterBand(1).GetMaskBand()
-        assert msk.Checksum() == 0, (
-            "did not get expected mask checksum for type %s : %d"
-            % gdal.GetDataTypeName(typ, msk.Checksum())
-        )
+    assert (
+        ds.GetRasterBand(1).GetMaskFlags() == gdal.GMF_NODATA
+    ), "did not get expected mask flags"
 
-        msk = None
-        ds = None
-        drv.Delete("tmp/mask20.tif")
+    msk = ds.GetRasterBand(1).GetMaskBand()
+    cs = msk.Checksum()
+    assert cs == 0, "did not get expected mask checksum: %d" % cs
+
+    msk = None
+    ds = None
 
 
 ###############################################################################
 # Extensive test of NODATA_VALUES mask for all data types
 
 
-def test_mask_21():
+@pytest.mark.perf_class("io")
+@pytest.mark.parametrize(
+    "typ,nodatavalue",
+    nodata_types_and_values,
+    ids=[gdal.GetDataTypeName(typ) for typ, _ in nodata_types_and_values],
+)
+def test_mask_21(tmp_vsimem, gtiff_drv, typ, nodatavalue):
 
-    types = [
-        gdal.GDT_Byte,
-        gdal.GDT_Int16,
-        gdal.GDT_UInt16,
-        gdal.GDT_Int32,
-        gdal.GDT_UInt32,
-        gdal.GDT_Float32,
-        gdal.GDT_Float64,
-        gdal.GDT_CFloat32,
-        gdal.GDT_CFloat64,
-    ]
-
-    nodatavalue = [1, -1, 1, -1, 1, 0.5, 0.5, 0.5, 0.5]
-
-    drv = gdal.GetDriverByName("GTiff")
-    for i, typ in enumerate(types):
-        ds = drv.Create("tmp/mask21.tif", 1, 1, 3, typ)
-        md = {}
-        md["NODATA_VALUES"] = "%f %f %f" % (
-            nodatavalue[i],
-            nodatavalue[i],
-            nodatavalue[i],
-        )
-        ds.SetMetadata(md)
-        ds.GetRasterBand(1).Fill(nodatavalue[i])
-        ds.GetRasterBand(2).Fill(nodatavalue[i])
-        ds.GetRasterBand(3).Fill(nodatavalue[i])
+    filename = str(tmp_vsimem / "mask21.tif")
 
-        assert (
-            ds.GetRasterBand(1).GetMaskFlags() == gdal.GMF_PER_DATASET + gdal.GMF_NODATA
-        ), "did not get expected mask flags for type %s" % gdal.GetDataTypeName(typ)
+    ds = gtiff_drv.Create(filename, 1, 1, 3, typ)
+    md = {}
+    md["NODATA_VALUES"] = "%f %f %f" % (nodatavalue, nodatavalue, nodatavalue)
+    ds.SetMetadata(md)
+    ds.GetRasterBand(1).Fill(nodatavalue)
+    ds.GetRasterBand(2).Fill(nodatavalue)
+    ds.GetRasterBand(3).Fill(nodatavalue)
 
-        msk = ds.GetRasterBand(1).GetMaskBand()
-        assert msk.Checksum() == 0, (
-            "did not get expected mask checksum for type %s : %d"
-            % gdal.GetDataTypeName(typ, msk.Checksum())
-        )
+    assert (
+        ds.GetRasterBand(1).GetMaskFlags() == gdal.GMF_PER_DATASET + gdal.GMF_NODATA
+    ), "did not get expected mask flags"
 
-        msk = None
-        ds = None
-        drv.Delete("tmp/mask21.tif")
+    msk = ds.GetRasterBand(1).GetMaskBand()
+    cs = msk.Checksum()
+    assert cs == 0, "did not get expected mask checksum: %d" % cs
+
+    msk = None
+    ds = None
 
 
 ###############################################################################
 # Test creation of external TIFF mask band just after Create()
 
 
-def test_mask_22():
+@pytest.mark.perf_class("io")
+def test_mask_22(gtiff_drv):
 
-    drv = gdal.GetDriverByName("GTiff")
-    ds = drv.Create("tmp/mask_22.tif", 20, 20)
+    ds = gtiff_drv.Create("/vsimem/mask_22.tif", 20, 20)
     with gdal.config_option("GDAL_TIFF_INTERNAL_MASK", "NO"):
         ds.CreateMaskBand(gdal.GMF_PER_DATASET)
 
@@ -774,12 +773,9 @@ def test_mask_22():
 
     ds = None
 
-    try:
-        os.stat("tmp/mask_22.tif.msk")
-    except OSError:
-        pytest.fail("tmp/mask_22.tif.msk is absent")
+    assert gdal.VSIStatL("/vsimem/mask_22.tif.msk") is not None
 
-    ds = gdal.Open("tmp/mask_22.tif")
+    ds = gdal.Open("/vsimem/mask_22.tif")
 
     assert (
         ds.GetRasterBand(1).GetMaskFlags() == gdal.GMF_PER_DATASET
@@ -790,9 +786,9 @@ def test_mask_22():
 
     ds = None
 
-    drv.Delete("tmp/mask_22.tif")
+    gtiff_drv.Delete("/vsimem/mask_22.tif")
 
-    assert not os.path.exists("tmp/mask_22.tif.msk")
+    assert gdal.VSIStatL("/vsimem/mask_22.tif.msk") is None
 
 
 ###############################################################################
@@ -800,29 +796,28 @@ def test_mask_22():
 # internal mask (#3800)
 
 
+@pytest.mark.perf_class("io")
 @pytest.mark.require_creation_option("GTiff", "JPEG")
-def test_mask_23():
-
-    drv = gdal.GetDriverByName("GTiff")
+def test_mask_23(gtiff_drv):
 
-    src_ds = drv.Create(
-        "tmp/mask_23_src.tif", 3000, 2000, 3, options=["TILED=YES", "SPARSE_OK=YES"]
+    src_ds = gtiff_drv.Create(
+        "/vsimem/mask_23_src.tif", 3000, 2000, 3, options=["TILED=YES", "SPARSE_OK=YES"]
     )
     with gdal.config_option("GDAL_TIFF_INTERNAL_MASK", "NO"):
         src_ds.CreateMaskBand(gdal.GMF_PER_DATASET)
 
     gdal.ErrorReset()
     with gdaltest.SetCacheMax(15000000):
-        ds = drv.CreateCopy(
-            "tmp/mask_23_dst.tif", src_ds, options=["TILED=YES", "COMPRESS=JPEG"]
+        ds = gtiff_drv.CreateCopy(
+            "/vsimem/mask_23_dst.tif", src_ds, options=["TILED=YES", "COMPRESS=JPEG"]
         )
 
     del ds
     error_msg = gdal.GetLastErrorMsg()
     src_ds = None
 
-    drv.Delete("tmp/mask_23_src.tif")
-    drv.Delete("tmp/mask_23_dst.tif")
+    gtiff_drv.Delete("/vsimem/mask_23_src.tif")
+    gtiff_drv.Delete("/vsimem/mask_23_dst.tif")
 
     # 'ERROR 1: TIFFRewriteDirectory:Error fetching directory count' was triggered before
     assert error_msg == ""
@@ -832,9 +827,9 @@ def test_mask_23():
 # Test on a GDT_UInt16 RGBA (#5692)
 
 
-def test_mask_24():
+def test_mask_24(gtiff_drv):
 
-    ds = gdal.GetDriverByName("GTiff").Create(
+    ds = gtiff_drv.Create(
         "/vsimem/mask_24.tif",
         100,
         100,
@@ -853,18 +848,15 @@ def test_mask_24():
     mask = ds.GetRasterBand(1).GetMaskBand()
 
     # IRasterIO() optimized case
-    import struct
-
-    assert struct.unpack("B", mask.ReadRaster(0, 0, 1, 1))[0] == 255
+    assert mask.ReadRaster() == b"\xff" * (100 * 100)
 
     # IReadBlock() code path
-    (blockx, blocky) = mask.GetBlockSize()
-    assert struct.unpack("B" * blockx * blocky, mask.ReadBlock(0, 0))[0] == 255
+    assert mask.ReadBlock(0, 0)[0] == 255
     mask.FlushCache()
 
     # Test special case where dynamics is only 0-255
     ds.GetRasterBand(4).Fill(255)
-    assert struct.unpack("B", mask.ReadRaster(0, 0, 1, 1))[0] == 1
+    assert mask.ReadRaster() == b"\x01" * (100 * 100)
 
     ds = None
 
@@ -875,14 +867,14 @@ def test_mask_24():
 # Test various error conditions
 
 
-def test_mask_25():
+def test_mask_25(gtiff_drv):
 
-    ds = gdal.GetDriverByName("GTiff").Create("/vsimem/mask_25.tif", 1, 1)
+    ds = gtiff_drv.Create("/vsimem/mask_25.tif", 1, 1)
     assert ds.GetRasterBand(1).GetMaskFlags() == gdal.GMF_ALL_VALID
     ds = None
 
     # No INTERNAL_MASK_FLAGS_x metadata
-    gdal.GetDriverByName("GTiff").Create("/vsimem/mask_25.tif.msk", 1, 1)
+    gtiff_drv.Create("/vsimem/mask_25.tif.msk", 1, 1)
     ds = gdal.Open("/vsimem/mask_25.tif")
     assert ds.GetRasterBand(1).GetMaskFlags() == gdal.GMF_ALL_VALID
     cs = ds.GetRasterBand(1).GetMaskBand().Checksum()
@@ -892,7 +884,7 @@ def test_mask_25():
     gdal.Unlink("/vsimem/mask_25.tif.msk")
 
     # Per-band mask
-    ds = gdal.GetDriverByName("GTiff").Create("/vsimem/mask_25.tif", 1, 1)
+    ds = gtiff_drv.Create("/vsimem/mask_25.tif", 1, 1)
     with gdal.config_option("GDAL_TIFF_INTERNAL_MASK", "NO"):
         ds.GetRasterBand(1).CreateMaskBand(0)
     ds = None
@@ -905,8 +897,8 @@ def test_mask_25():
     gdal.Unlink("/vsimem/mask_25.tif.msk")
 
     # .msk file does not have enough bands
-    gdal.GetDriverByName("GTiff").Create("/vsimem/mask_25.tif", 1, 1, 2)
-    ds = gdal.GetDriverByName("GTiff").Create("/vsimem/mask_25.tif.msk", 1, 1)
+    gtiff_drv.Create("/vsimem/mask_25.tif", 1, 1, 2)
+    ds = gtiff_drv.Create("/vsimem/mask_25.tif.msk", 1, 1)
     ds.SetMetadataItem("INTERNAL_MASK_FLAGS_2", "0")
     ds = None
     ds = gdal.Open("/vsimem/mask_25.tif")
@@ -917,7 +909,7 @@ def test_mask_25():
     gdal.Unlink("/vsimem/mask_25.tif.msk")
 
     # Invalid sequences of CreateMaskBand() calls
-    ds = gdal.GetDriverByName("GTiff").Create("/vsimem/mask_25.tif", 1, 1, 2)
+    ds = gtiff_drv.Create("/vsimem/mask_25.tif", 1, 1, 2)
     with gdal.config_option("GDAL_TIFF_INTERNAL_MASK", "NO"):
         ds.GetRasterBand(1).CreateMaskBand(gdal.GMF_PER_DATASET)
     with gdal.quiet_errors():
@@ -937,9 +929,9 @@ def test_mask_25():
 # Test on a GDT_UInt16 1band data
 
 
-def test_mask_26():
+def test_mask_26(gtiff_drv):
 
-    ds = gdal.GetDriverByName("GTiff").Create(
+    ds = gtiff_drv.Create(
         "/vsimem/mask_26.tif", 100, 100, 2, gdal.GDT_UInt16, options=["ALPHA=YES"]
     )
     ds.GetRasterBand(1).Fill(65565)
@@ -951,44 +943,154 @@ def test_mask_26():
     mask = ds.GetRasterBand(1).GetMaskBand()
 
     # IRasterIO() optimized case
-    import struct
-
-    assert struct.unpack("B", mask.ReadRaster(0, 0, 1, 1))[0] == 255
+    assert mask.ReadRaster() == b"\xff" * (100 * 100)
 
     ds = None
 
     gdal.Unlink("/vsimem/mask_26.tif")
 
 
+###############################################################################
+# Width of the lines used to test the SSE2 code paths of the mask bands: two
+# iterations of 16 pixels, plus trailing pixels for the scalar code path
+
+
+wide_line_width = 37
+
+
+###############################################################################
+# Write each line of band with the values of vals repeated cyclically, and
+# return the values of a line. Complex values are (real, imaginary) tuples.
+
+
+def write_cyclic_lines(band, vals, buf_type):
+
+    data = [vals[i % len(vals)] for i in range(band.XSize)]
+    flat_data = [x for v in data for x in (v if isinstance(v, tuple) else (v,))]
+    fmt = "H" if buf_type == gdal.GDT_UInt16 else "d"
+    buf = struct.pack(fmt * len(flat_data), *flat_data)
+    for y in range(band.YSize):
+        band.WriteRaster(0, y, band.XSize, 1, buf, buf_type=buf_type)
+
+    return data
+
+
+###############################################################################
+# Test rescaling of a GDT_UInt16 alpha band on a line wide enough to use the
+# SSE2 code path
+
+
+def test_mask_rescaled_alpha_uint16(tmp_vsimem, gtiff_drv):
+
+    ds = gtiff_drv.Create(
+        str(tmp_vsimem / "mask_rescaled_alpha_uint16.tif"),
+        wide_line_width,
+        1,
+        2,
+        gdal.GDT_UInt16,
+        options=["ALPHA=YES"],
+    )
+    data = write_cyclic_lines(
+        ds.GetRasterBand(2),
+        [0, 1, 255, 256, 257, 513, 32767, 32768, 65534, 65535, 12345],
+        gdal.GDT_UInt16,
+    )
+    expected = [1 if v > 0 and v < 257 else (v * 255) // 65535 for v in data]
+
+    mask = ds.GetRasterBand(1).GetMaskBand()
+    assert list(mask.ReadRaster()) == expected
+
+    ds = None
+
+
 ###############################################################################
 # Extensive test of nodata mask for all complex types using real part only
 
 
-def test_mask_27():
+complex_nodata_types_and_values = [
+    (gdal.GDT_CFloat32, 0.5),
+    (gdal.GDT_CFloat64, 0.5),
+]
 
-    types = [gdal.GDT_CFloat32, gdal.GDT_CFloat64]
 
-    nodatavalue = [0.5, 0.5]
+@pytest.mark.parametrize(
+    "typ,nodatavalue",
+    complex_nodata_types_and_values,
+    ids=[gdal.GetDataTypeName(typ) for typ, _ in complex_nodata_types_and_values],
+)
+def test_mask_27(tmp_vsimem, gtiff_drv, typ, nodatavalue):
 
-    drv = gdal.GetDriverByName("GTiff")
-    for i, typ in enumerate(types):
-        ds = drv.Create("tmp/mask27.tif", 1, 1, 1, typ)
-        ds.GetRasterBand(1).Fill(nodatavalue[i], 10)
-        ds.GetRasterBand(1).SetNoDataValue(nodatavalue[i])
+    ds = gtiff_drv.Create(str(tmp_vsimem / "mask27.tif"), 1, 1, 1, typ)
+    ds.GetRasterBand(1).WriteRaster(
+        0, 0, 1, 1, struct.pack("dd", nodatavalue, 10), buf_type=gdal.GDT_CFloat64
+    )
+    ds.GetRasterBand(1).SetNoDataValue(nodatavalue)
 
-        assert (
-            ds.GetRasterBand(1).GetMaskFlags() == gdal.GMF_NODATA
-        ), "did not get expected mask flags for type %s" % gdal.GetDataTypeName(typ)
+    # Only the real part is equal to the nodata value
+    assert struct.unpack(
+        "dd", ds.GetRasterBand(1).ReadRaster(buf_type=gdal.GDT_CFloat64)
+    ) == (nodatavalue, 10)
 
-        msk = ds.GetRasterBand(1).GetMaskBand()
-        assert msk.Checksum() == 0, (
-            "did not get expected mask checksum for type %s : %d"
-            % gdal.GetDataTypeName(typ, msk.Checksum())
-        )
+    assert (
+        ds.GetRasterBand(1).GetMaskFlags() == gdal.GMF_NODATA
+    ), "did not get expected mask flags for type %s" % gdal.GetDataTypeName(typ)
 
-        msk = None
-        ds = None
-        drv.Delete("tmp/mask27.tif")
+    msk = ds.GetRasterBand(1).GetMaskBand()
+    minmax = msk.ComputeRasterMinMax(False)
+    assert minmax == (0, 0), "did not get expected mask values for type %s : %s" % (
+        gdal.GetDataTypeName(typ),
+        str(minmax),
+    )
+
+    msk = None
+    ds = None
+
+
+###############################################################################
+# Test nodata mask of Float32/Float64 bands wide enough to use the SSE2 code
+# path, as well as the scalar one for the trailing pixels
+
+
+@pytest.mark.parametrize("dt", [gdal.GDT_Float32, gdal.GDT_Float64])
+@pytest.mark.parametrize("nodata", [0.5, float("nan")])
+def test_mask_nodata_float(dt, nodata):
+
+    ds = gdal.GetDriverByName("MEM").Create("", wide_line_width, 2, 1, dt)
+    data = write_cyclic_lines(
+        ds.GetRasterBand(1),
+        [0.5, 0.5 + 1e-8, 1.5, -0.5, float("nan"), float("inf"), 0, 1e-40],
+        gdal.GDT_Float64,
+    )
+    if nodata == nodata:
+        expected = [0 if v == nodata or v == 0.5 + 1e-8 else 255 for v in data]
+    else:
+        expected = [0 if v != v else 255 for v in data]
+    ds.GetRasterBand(1).SetNoDataValue(nodata)
+
+    msk = ds.GetRasterBand(1).GetMaskBand()
+    assert list(msk.ReadRaster()) == expected * 2
+    assert list(msk.ReadRaster(1, 1, wide_line_width - 1, 1)) == expected[1:]
+
+
+###############################################################################
+# Test nodata mask of CFloat32/CFloat64 bands wide enough to use the SSE2 code
+# path. Only the real part is compared to the nodata value.
+
+
+@pytest.mark.parametrize("dt", [gdal.GDT_CFloat32, gdal.GDT_CFloat64])
+def test_mask_nodata_complex(dt):
+
+    ds = gdal.GetDriverByName("MEM").Create("", wide_line_width, 1, 1, dt)
+    data = write_cyclic_lines(
+        ds.GetRasterBand(1),
+        [(0.5, 0), (0.5, 10), (0.5, float("nan")), (1.5, 0.5), (0, 0.5)],
+        gdal.GDT_CFloat64,
+    )
+    expected = [0 if re == 0.5 else 255 for re, _ in data]
+    ds.GetRasterBand(1).SetNoDataValue(0.5)
+
+    msk = ds.GetRasterBand(1).GetMaskBand()
+    assert list(msk.ReadRaster()) == expected
 
 
 ###############################################################################
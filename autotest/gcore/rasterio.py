@@ -3282,3 +3282,38 @@ def test_rasterio_overview_selection():
         assert ds.GetRasterBand(1).ReadRaster(0, 0, 100, 100, 29, 29)[0] == 2
         assert ds.GetRasterBand(1).ReadRaster(0, 0, 100, 100, 25, 25)[0] == 3
         assert ds.GetRasterBand(1).ReadRaster(0, 0, 100, 100, 24, 24)[0] == 3
+
+
+###############################################################################
+# Test GDALRasterBand::Fill(), both with values that can be set with memset()
+# and values that cannot
+
+
+@pytest.mark.parametrize(
+    "dt,struct_type,val",
+    [
+        (gdal.GDT_Byte, "B", 0),
+        (gdal.GDT_Byte, "B", 123),
+        (gdal.GDT_UInt16, "H", 0),
+        (gdal.GDT_UInt16, "H", 257),
+        (gdal.GDT_UInt16, "H", 256),
+        (gdal.GDT_Int32, "i", -1),
+        (gdal.GDT_Float32, "f", 1.5),
+        (gdal.GDT_Float64, "d", 0),
+        (gdal.GDT_Float64, "d", -0.0),
+    ],
+)
+def test_rasterio_fill(dt, struct_type, val):
+
+    ds = gdal.GetDriverByName("MEM").Create("", 3, 5, 1, dt)
+    ds.GetRasterBand(1).Fill(val)
+    assert ds.GetRasterBand(1).ReadRaster() == struct.pack(
+        struct_type * (3 * 5), *([val] * (3 * 5))
+    )
+
+
+def test_rasterio_fill_complex():
+
+    ds = gdal.GetDriverByName("MEM").Create("", 3, 5, 1, gdal.GDT_CFloat32)
+    ds.GetRasterBand(1).Fill(1.5, -2.5)
+    assert ds.GetRasterBand(1).ReadRaster() == struct.pack("f" * 2, 1.5, -2.5) * (3 * 5)
@@ -2919,3 +2919,38 @@ def test_tiff_ovr_JXL_ALPHA_DISTANCE_OVERVIEW(tmp_vsimem):
     assert ds.GetRasterBand(4).Checksum() != cs4
     del ds
     gdal.Unlink(tmpfilename + ".ovr")
+
+
+###############################################################################
+# Test nearest neighbour decimation of a Byte band, by a factor of 2 (which
+# has a SSE2 optimized code path), and by a non-integer factor.
+
+
+@pytest.mark.parametrize("width", [74, 75])
+def test_tiff_ovr_nearest_byte(tmp_vsimem, width):
+
+    height = 10
+    src_data = bytes(
+        (x * 7 + y * 13) % 256 for y in range(height) for x in range(width)
+    )
+
+    tmpfilename = str(tmp_vsimem / "test_tiff_ovr_nearest_byte.tif")
+    ds = gdal.GetDriverByName("GTiff").Create(tmpfilename, width, height)
+    ds.GetRasterBand(1).WriteRaster(0, 0, width, height, src_data)
+    ds.BuildOverviews("NEAREST", [2])
+    ovr = ds.GetRasterBand(1).GetOverview(0)
+    ovr_width = ovr.XSize
+    assert ovr_width == (width + 1) // 2
+    assert ovr.YSize == height // 2
+
+    # Same computation of the source pixel as GDALResampleChunk_NearT(), the
+    # ratio being computed first
+    x_ratio = width / ovr_width
+    y_ratio = height / ovr.YSize
+    expected = bytearray()
+    for j in range(ovr.YSize):
+        src_y = int(0.5 + j * y_ratio)
+        for i in range(ovr_width):
+            src_x = int(0.5 + i * x_ratio)
+            expected.append(src_data[src_y * width + src_x])
+    assert ovr.ReadRaster() == expected
@@ -31,14 +31,16 @@
 # DEALINGS IN THE SOFTWARE.
 ###############################################################################
 
-import os
-import shutil
-
+import gdaltest
 import pytest
 
 from osgeo import gdal, gnm
 
-pytestmark = pytest.mark.require_driver("GNMFile")
+pytestmark = [
+    pytest.mark.require_driver("GNMFile"),
+    pytest.mark.random_order(disabled=True),
+    pytest.mark.xdist_group("gnm_test"),
+]
 
 ###############################################################################
 # Create file base network
@@ -46,14 +48,11 @@ pytestmark = pytest.mark.require_driver("GNMFile")
 
 def test_gnm_filenetwork_create():
 
-    try:
-        shutil.rmtree("tmp/test_gnm")
-    except OSError:
-        pass
+    if gdal.VSIStatL("/vsimem/test_gnm") is not None:
+        gdal.RmdirRecursive("/vsimem/test_gnm")
 
-    drv = gdal.GetDriverByName("GNMFile")
-    ds = drv.Create(
-        "tmp/",
+    ds = gdaltest.gnmfile_drv.Create(
+        "/vsimem/",
         0,
         0,
         0,
@@ -82,7 +81,9 @@ def test_gnm_filenetwork_create():
 
 def test_gnm_filenetwork_open():
 
-    ds = gdal.OpenEx("tmp/test_gnm")
+    # The dataset is kept open for the following tests, until test_gnm_delete
+    gdaltest.gnm_ds = gdal.OpenEx("/vsimem/test_gnm")
+    ds = gdaltest.gnm_ds
     # cast to GNM
     dn = gnm.CastToNetwork(ds)
     assert dn is not None
@@ -101,7 +102,7 @@ def test_gnm_filenetwork_open():
 
 def test_gnm_import():
 
-    ds = gdal.OpenEx("tmp/test_gnm")
+    ds = gdaltest.gnm_ds
 
     # pipes
     dspipes = gdal.OpenEx("data/pipes.shp", gdal.OF_VECTOR)
@@ -121,8 +122,6 @@ def test_gnm_import():
 
     assert ds.GetLayerCount() == 2, "expected 2 layers"
 
-    ds = None
-
 
 ###############################################################################
 # autoconnect
@@ -130,7 +129,7 @@ def test_gnm_import():
 
 def test_gnm_autoconnect():
 
-    ds = gdal.OpenEx("tmp/test_gnm")
+    ds = gdaltest.gnm_ds
     dgn = gnm.CastToGenericNetwork(ds)
     assert dgn is not None, "cast to GNMGenericNetwork failed"
 
@@ -143,19 +142,28 @@ def test_gnm_autoconnect():
 
 
 ###############################################################################
-# Dijkstra shortest path
+# Dijkstra shortest path, KShortest Paths and ConnectedComponents
 
 
-def test_gnm_graph_dijkstra():
+@pytest.mark.parametrize(
+    "algorithm,options,min_feature_count",
+    [
+        (gnm.GATDijkstraShortestPath, None, 1),
+        (gnm.GATKShortestPath, ["num_paths=3"], 20),
+        (gnm.GATConnectedComponents, None, 1),
+    ],
+    ids=["dijkstra", "kshortest", "connectedcomponents"],
+)
+def test_gnm_graph(algorithm, options, min_feature_count):
 
-    ds = gdal.OpenEx("tmp/test_gnm")
+    ds = gdaltest.gnm_ds
     dn = gnm.CastToNetwork(ds)
     assert dn is not None, "cast to GNMNetwork failed"
 
-    lyr = dn.GetPath(61, 50, gnm.GATDijkstraShortestPath)
+    lyr = dn.GetPath(61, 50, algorithm, options=options)
     assert lyr is not None, "failed to get path"
 
-    if lyr.GetFeatureCount() == 0:
+    if lyr.GetFeatureCount() < min_feature_count:
         dn.ReleaseResultSet(lyr)
         pytest.fail("failed to get path")
 
@@ -164,44 +172,74 @@ def test_gnm_graph_dijkstra():
 
 
 ###############################################################################
-# KShortest Paths
+# Compare the paths found by the Dijkstra algorithm with and without the
+# bidirectional option
 
 
-def test_gnm_graph_kshortest():
+def get_dijkstra_path(dn, start, end, options=None):
 
-    ds = gdal.OpenEx("tmp/test_gnm")
-    dn = gnm.CastToNetwork(ds)
-    assert dn is not None, "cast to GNMNetwork failed"
-
-    lyr = dn.GetPath(61, 50, gnm.GATKShortestPath, options=["num_paths=3"])
+    lyr = dn.GetPath(start, end, gnm.GATDijkstraShortestPath, options=options)
     assert lyr is not None, "failed to get path"
 
-    if lyr.GetFeatureCount() < 20:
-        dn.ReleaseResultSet(lyr)
-        pytest.fail("failed to get path")
+    vertices = []
+    edges = []
+    for f in lyr:
+        if f["ftype"] == "VERTEX":
+            vertices.append(f["gnm_fid"])
+        else:
+            edges.append(f["gnm_fid"])
 
     dn.ReleaseResultSet(lyr)
+
+    return vertices, edges
+
+
+def test_gnm_graph_dijkstra_bidirectional():
+
+    dn = gnm.CastToNetwork(gdaltest.gnm_ds)
+    assert dn is not None, "cast to GNMNetwork failed"
+
+    vertices, edges = get_dijkstra_path(dn, 61, 50)
+    bidir_vertices, bidir_edges = get_dijkstra_path(
+        dn, 61, 50, options=["bidirectional=YES"]
+    )
+
+    assert vertices[0] == 61 and vertices[-1] == 50
+    assert bidir_vertices[0] == 61 and bidir_vertices[-1] == 50
+    assert len(bidir_vertices) == len(bidir_edges) + 1
+    # All the connections made by test_gnm_autoconnect have a cost of 1
+    assert len(bidir_edges) == len(edges)
+
+    # Same start and end points
+    for options in (None, ["bidirectional=YES"]):
+        assert get_dijkstra_path(dn, 61, 61, options=options) == ([61], [])
+
+    # End point not in the network
+    for options in (None, ["bidirectional=YES"]):
+        assert get_dijkstra_path(dn, 61, 1000000, options=options) == ([], [])
+
     dn = None
 
 
 ###############################################################################
-# ConnectedComponents
+# Reopen the network, so that the graph is loaded from what was saved by
+# test_gnm_autoconnect, and search a path in it
 
 
-def test_gnm_graph_connectedcomponents():
+def test_gnm_reopen():
 
-    ds = gdal.OpenEx("tmp/test_gnm")
-    dn = gnm.CastToNetwork(ds)
-    assert dn is not None, "cast to GNMNetwork failed"
+    gdaltest.gnm_ds = None
 
-    lyr = dn.GetPath(61, 50, gnm.GATConnectedComponents)
-    assert lyr is not None, "failed to get path"
+    gdaltest.gnm_ds = gdal.OpenEx("/vsimem/test_gnm")
+    assert gdaltest.gnm_ds is not None, "failed to reopen network"
 
-    if lyr.GetFeatureCount() == 0:
-        dn.ReleaseResultSet(lyr)
-        pytest.fail("failed to get path")
+    dn = gnm.CastToNetwork(gdaltest.gnm_ds)
+    assert dn is not None, "cast to GNMNetwork failed"
+
+    vertices, edges = get_dijkstra_path(dn, 61, 50)
+    assert vertices[0] == 61 and vertices[-1] == 50
+    assert len(vertices) == len(edges) + 1
 
-    dn.ReleaseResultSet(lyr)
     dn = None
 
 
@@ -211,6 +249,8 @@ def test_gnm_graph_connectedcomponents():
 
 def test_gnm_delete():
 
-    gdal.GetDriverByName("GNMFile").Delete("tmp/test_gnm")
+    gdaltest.gnm_ds = None
+
+    gdaltest.gnmfile_drv.Delete("/vsimem/test_gnm")
 
-    assert not os.path.exists("tmp/test_gnm")
+    assert gdal.VSIStatL("/vsimem/test_gnm") is None
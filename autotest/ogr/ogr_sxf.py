@@ -39,15 +39,25 @@ pytestmark = pytest.mark.require_driver("SXF")
 # Open SXF datasource.
 
 
-@pytest.fixture()
 def test_ogr_sxf_1():
 
     with gdal.quiet_errors():
         # Expect Warning 0 and Warning 6.
-        ds = ogr.Open("data/sxf/100_test.sxf")
+        ds = gdal.OpenEx(
+            "data/sxf/100_test.sxf",
+            gdal.OF_VECTOR,
+            open_options=["SXF_LAYER_FULLNAME=NO"],
+        )
 
     assert ds is not None
 
+    # The feature count of each layer is known from the index of records
+    # built when opening the file, without reading the features.
+    for lyr in ds:
+        assert lyr.TestCapability(ogr.OLCFastFeatureCount)
+        feature_count = lyr.GetFeatureCount(force=0)
+        assert feature_count == len([f for f in lyr]), lyr.GetName()
+
 
 ###############################################################################
 # Run test_ogrsf
@@ -61,7 +71,7 @@ def test_ogr_sxf_2():
         pytest.skip()
 
     ret = gdaltest.runexternal(
-        test_cli_utilities.get_test_ogrsf_path() + " data/sxf/100_test.sxf"
+        test_cli_utilities.get_test_ogrsf_path() + " -ro data/sxf/100_test.sxf"
     )
 
     assert ret.find("INFO") != -1 and ret.find("ERROR") == -1
@@ -1228,6 +1228,16 @@ def gdal_data_type_to_python_struct_format(datatype):
     return type_char
 
 
+###############################################################################
+# Reference implementation of GDALChecksumImage() for a full Byte band,
+# independent of the C++ code. data is the content returned by ReadRaster().
+
+
+def byte_checksum(data):
+    primes = (7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43)
+    return sum(v % primes[i % 11] for i, v in enumerate(data)) & 0xFFFF
+
+
 ###############################################################################
 # Compare the values of the pixels
 
@@ -33,6 +33,7 @@
 
 #include <algorithm>
 #include <cstring>
+#include <limits>
 #include <utility>
 
 #include "cpl_conv.h"
@@ -41,6 +42,12 @@
 #include "gdal.h"
 #include "gdal_priv_templates.hpp"
 
+// Restrict to 64bit processors because they are guaranteed to have SSE2
+#if defined(__x86_64) || defined(_M_X64)
+#define USE_SSE2
+#include <emmintrin.h>
+#endif
+
 //! @cond Doxygen_Suppress
 /************************************************************************/
 /*                        GDALNoDataMaskBand()                          */
@@ -304,6 +311,127 @@ static void SetZeroOr255(GByte *pabyDest, const T *panSrc, int nBufXSize,
     }
 }
 
+/************************************************************************/
+/*                         SetZeroOr255Float()                          */
+/************************************************************************/
+
+#ifdef USE_SSE2
+
+// Returns 0xFFFFFFFF in the lanes where ARE_REAL_EQUAL(v, nodata) is true
+// (or where v is NaN if bIsNoDataNan), 0 otherwise.
+static inline __m128i IsNoData(__m128 v, __m128 nodata, bool bIsNoDataNan)
+{
+    const __m128 absMask = _mm_castsi128_ps(_mm_set1_epi32(0x7FFFFFFF));
+    const __m128 absDiff = _mm_and_ps(_mm_sub_ps(v, nodata), absMask);
+    const __m128 absSum = _mm_and_ps(_mm_add_ps(v, nodata), absMask);
+    const __m128 tolerance = _mm_mul_ps(
+        _mm_mul_ps(_mm_set1_ps(std::numeric_limits<float>::epsilon()), absSum),
+        _mm_set1_ps(2.0f));
+    __m128 res =
+        _mm_or_ps(_mm_cmpeq_ps(v, nodata), _mm_cmplt_ps(absDiff, tolerance));
+    if (bIsNoDataNan)
+        res = _mm_or_ps(res, _mm_cmpunord_ps(v, v));
+    return _mm_castps_si128(res);
+}
+
+static inline __m128i IsNoData(__m128d v, __m128d nodata, bool bIsNoDataNan)
+{
+    const __m128d absMask =
+        _mm_castsi128_pd(_mm_set1_epi64x(0x7FFFFFFFFFFFFFFFLL));
+    const __m128d absDiff = _mm_and_pd(_mm_sub_pd(v, nodata), absMask);
+    const __m128d absSum = _mm_and_pd(_mm_add_pd(v, nodata), absMask);
+    const __m128d tolerance = _mm_mul_pd(
+        _mm_mul_pd(_mm_set1_pd(std::numeric_limits<float>::epsilon()), absSum),
+        _mm_set1_pd(2.0));
+    __m128d res =
+        _mm_or_pd(_mm_cmpeq_pd(v, nodata), _mm_cmplt_pd(absDiff, tolerance));
+    if (bIsNoDataNan)
+        res = _mm_or_pd(res, _mm_cmpunord_pd(v, v));
+    return _mm_castpd_si128(res);
+}
+
+// Returns a 4 x 32-bit mask for pafSrc[0..3]
+static inline __m128i IsNoData4(const float *pafSrc, __m128 nodata,
+                                bool bIsNoDataNan)
+{
+    return IsNoData(_mm_loadu_ps(pafSrc), nodata, bIsNoDataNan);
+}
+
+static inline __m128i IsNoData4(const double *padfSrc, __m128d nodata,
+                                bool bIsNoDataNan)
+{
+    const __m128i lo = IsNoData(_mm_loadu_pd(padfSrc), nodata, bIsNoDataNan);
+    const __m128i hi =
+        IsNoData(_mm_loadu_pd(padfSrc + 2), nodata, bIsNoDataNan);
+    // Keep the low 32 bits of each 64-bit lane
+    return _mm_castps_si128(_mm_shuffle_ps(
+        _mm_castsi128_ps(lo), _mm_castsi128_ps(hi), _MM_SHUFFLE(2, 0, 2, 0)));
+}
+
+static inline __m128 Set1(float fVal)
+{
+    return _mm_set1_ps(fVal);
+}
+
+static inline __m128d Set1(double dfVal)
+{
+    return _mm_set1_pd(dfVal);
+}
+
+// Processes 16 values at a time, and returns the number of processed values
+template <class T>
+static int SetZeroOr255FloatSSE2(GByte *pabyDest, const T *pafSrc, int nCount,
+                                 T fNoData, bool bIsNoDataNan)
+{
+    const auto nodata = Set1(fNoData);
+    int i = 0;
+    for (; i + 15 < nCount; i += 16)
+    {
+        const __m128i m0 = IsNoData4(pafSrc + i, nodata, bIsNoDataNan);
+        const __m128i m1 = IsNoData4(pafSrc + i + 4, nodata, bIsNoDataNan);
+        const __m128i m2 = IsNoData4(pafSrc + i + 8, nodata, bIsNoDataNan);
+        const __m128i m3 = IsNoData4(pafSrc + i + 12, nodata, bIsNoDataNan);
+        // 0xFFFFFFFF / 0 lanes saturate to 0xFF / 0 bytes
+        const __m128i m =
+            _mm_packs_epi16(_mm_packs_epi32(m0, m1), _mm_packs_epi32(m2, m3));
+        _mm_storeu_si128(reinterpret_cast<__m128i *>(pabyDest + i),
+                         _mm_andnot_si128(m, _mm_set1_epi8(-1)));
+    }
+    return i;
+}
+
+#endif
+
+template <class T>
+static void SetZeroOr255Float(GByte *pabyDest, const T *pafSrc, int nBufXSize,
+                              int nBufYSize, GSpacing nPixelSpace,
+                              GSpacing nLineSpace, T fNoData, bool bIsNoDataNan)
+{
+    for (int iY = 0; iY < nBufYSize; iY++)
+    {
+        GByte *pabyLineDest = pabyDest + iY * nLineSpace;
+        int iX = 0;
+#ifdef USE_SSE2
+        if (nPixelSpace == 1)
+        {
+            iX = SetZeroOr255FloatSSE2(pabyLineDest, pafSrc, nBufXSize, fNoData,
+                                       bIsNoDataNan);
+        }
+#endif
+        for (; iX < nBufXSize; iX++)
+        {
+            const T fVal = pafSrc[iX];
+            if (bIsNoDataNan && CPLIsNan(fVal))
+                pabyLineDest[iX * nPixelSpace] = 0;
+            else if (ARE_REAL_EQUAL(fVal, fNoData))
+                pabyLineDest[iX * nPixelSpace] = 0;
+            else
+                pabyLineDest[iX * nPixelSpace] = 255;
+        }
+        pafSrc += nBufXSize;
+    }
+}
+
 /************************************************************************/
 /*                             IRasterIO()                              */
 /************************************************************************/
@@ -467,48 +595,18 @@ CPLErr GDALNoDataMaskBand::IRasterIO(GDALRWFlag eRWFlag, int nXOff, int nYOff,
             {
                 const float fNoData = static_cast<float>(m_dfNoDataValue);
                 const float *pafSrc = static_cast<const float *>(pTemp);
-
-                size_t i = 0;
-                for (int iY = 0; iY < nBufYSize; iY++)
-                {
-                    GByte *pabyLineDest = pabyDest + iY * nLineSpace;
-                    for (int iX = 0; iX < nBufXSize; iX++)
-                    {
-                        const float fVal = pafSrc[i];
-                        if (bIsNoDataNan && CPLIsNan(fVal))
-                            *pabyLineDest = 0;
-                        else if (ARE_REAL_EQUAL(fVal, fNoData))
-                            *pabyLineDest = 0;
-                        else
-                            *pabyLineDest = 255;
-                        ++i;
-                        pabyLineDest += nPixelSpace;
-                    }
-                }
+                SetZeroOr255Float(pabyDest, pafSrc, nBufXSize, nBufYSize,
+                                  nPixelSpace, nLineSpace, fNoData,
+                                  bIsNoDataNan);
             }
             break;
 
             case GDT_Float64:
             {
                 const double *padfSrc = static_cast<const double *>(pTemp);
-
-                size_t i = 0;
-                for (int iY = 0; iY < nBufYSize; iY++)
-                {
-                    GByte *pabyLineDest = pabyDest + iY * nLineSpace;
-                    for (int iX = 0; iX < nBufXSize; iX++)
-                    {
-                        const double dfVal = padfSrc[i];
-                        if (bIsNoDataNan && CPLIsNan(dfVal))
-                            *pabyLineDest = 0;
-                        else if (ARE_REAL_EQUAL(dfVal, m_dfNoDataValue))
-                            *pabyLineDest = 0;
-                        else
-                            *pabyLineDest = 255;
-                        ++i;
-                        pabyLineDest += nPixelSpace;
-                    }
-                }
+                SetZeroOr255Float(pabyDest, padfSrc, nBufXSize, nBufYSize,
+                                  nPixelSpace, nLineSpace, m_dfNoDataValue,
+                                  bIsNoDataNan);
             }
             break;
 
@@ -1577,25 +1577,44 @@ CPLErr GDALRasterBand::Fill(double dfRealValue, double dfImaginaryValue)
     if (!InitBlockInfo())
         return CE_Failure;
 
-    // Allocate the source block.
+    // Convert the value to the native type of the band.
     auto blockSize = static_cast<GPtrDiff_t>(nBlockXSize) * nBlockYSize;
     int elementSize = GDALGetDataTypeSizeBytes(eDataType);
     auto blockByteSize = blockSize * elementSize;
-    unsigned char *srcBlock =
-        static_cast<unsigned char *>(VSIMalloc(blockByteSize));
-    if (srcBlock == nullptr)
+    double complexSrc[2] = {dfRealValue, dfImaginaryValue};
+    GByte abyElement[2 * sizeof(double)];
+    GDALCopyWords(complexSrc, GDT_CFloat64, 0, abyElement, eDataType, 0, 1);
+
+    // If all the bytes of the value are identical (which is always the
+    // case for Byte, and for zero in all data types), blocks can be directly
+    // memset(), without going through a temporary source block.
+    bool bCanUseMemset = true;
+    for (int i = 1; i < elementSize; ++i)
     {
-        ReportError(CE_Failure, CPLE_OutOfMemory,
-                    "GDALRasterBand::Fill(): Out of memory "
-                    "allocating " CPL_FRMT_GUIB " bytes.\n",
-                    static_cast<GUIntBig>(blockByteSize));
-        return CE_Failure;
+        if (abyElement[i] != abyElement[0])
+        {
+            bCanUseMemset = false;
+            break;
+        }
     }
 
-    // Initialize the source block.
-    double complexSrc[2] = {dfRealValue, dfImaginaryValue};
-    GDALCopyWords64(complexSrc, GDT_CFloat64, 0, srcBlock, eDataType,
-                    elementSize, blockSize);
+    // Allocate and initialize the source block.
+    unsigned char *srcBlock = nullptr;
+    if (!bCanUseMemset)
+    {
+        srcBlock = static_cast<unsigned char *>(VSIMalloc(blockByteSize));
+        if (srcBlock == nullptr)
+        {
+            ReportError(CE_Failure, CPLE_OutOfMemory,
+                        "GDALRasterBand::Fill(): Out of memory "
+                        "allocating " CPL_FRMT_GUIB " bytes.\n",
+                        static_cast<GUIntBig>(blockByteSize));
+            return CE_Failure;
+        }
+
+        GDALCopyWords64(complexSrc, GDT_CFloat64, 0, srcBlock, eDataType,
+                        elementSize, blockSize);
+    }
 
     const bool bCallLeaveReadWrite = CPL_TO_BOOL(EnterReadWrite(GF_Write));
 
@@ -1610,10 +1629,15 @@ CPLErr GDALRasterBand::Fill(double dfRealValue, double dfImaginaryValue)
                 ReportError(CE_Failure, CPLE_OutOfMemory,
                             "GDALRasterBand::Fill(): Error "
                             "while retrieving cache block.");
+                if (bCallLeaveReadWrite)
+                    LeaveReadWrite();
                 VSIFree(srcBlock);
                 return CE_Failure;
             }
-            memcpy(destBlock->GetDataRef(), srcBlock, blockByteSize);
+            if (bCanUseMemset)
+                memset(destBlock->GetDataRef(), abyElement[0], blockByteSize);
+            else
+                memcpy(destBlock->GetDataRef(), srcBlock, blockByteSize);
             destBlock->MarkDirty();
             destBlock->DropLock();
         }
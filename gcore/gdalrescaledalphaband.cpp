@@ -36,6 +36,12 @@
 #include "cpl_vsi.h"
 #include "gdal.h"
 
+// Restrict to 64bit processors because they are guaranteed to have SSE2
+#if defined(__x86_64) || defined(_M_X64)
+#define USE_SSE2
+#include <emmintrin.h>
+#endif
+
 //! @cond Doxygen_Suppress
 /************************************************************************/
 /*                        GDALRescaledAlphaBand()                       */
@@ -89,6 +95,48 @@ CPLErr GDALRescaledAlphaBand::IReadBlock(int nXBlockOff, int nYBlockOff,
                      nBlockXSize, &sExtraArg);
 }
 
+/************************************************************************/
+/*                          RescaleAlphaLine()                          */
+/************************************************************************/
+
+static void RescaleAlphaLine(GByte *pabyImage, const GUInt16 *pSrc, int nCount)
+{
+    int i = 0;
+#ifdef USE_SSE2
+    // (x * 255) / 65535 == x / 257 == ((x * 65281) >> 16) >> 8 for all
+    // 16-bit values.
+    const __m128i magic = _mm_set1_epi16(static_cast<short>(65281));
+    const __m128i zero = _mm_setzero_si128();
+    const __m128i one = _mm_set1_epi16(1);
+    for (; i + 15 < nCount; i += 16)
+    {
+        const __m128i lo =
+            _mm_loadu_si128(reinterpret_cast<const __m128i *>(pSrc + i));
+        const __m128i hi =
+            _mm_loadu_si128(reinterpret_cast<const __m128i *>(pSrc + i + 8));
+        __m128i lo_res = _mm_srli_epi16(_mm_mulhi_epu16(lo, magic), 8);
+        __m128i hi_res = _mm_srli_epi16(_mm_mulhi_epu16(hi, magic), 8);
+        // Non-zero alpha must remain non-zero
+        lo_res = _mm_max_epi16(
+            lo_res, _mm_andnot_si128(_mm_cmpeq_epi16(lo, zero), one));
+        hi_res = _mm_max_epi16(
+            hi_res, _mm_andnot_si128(_mm_cmpeq_epi16(hi, zero), one));
+        _mm_storeu_si128(reinterpret_cast<__m128i *>(pabyImage + i),
+                         _mm_packus_epi16(lo_res, hi_res));
+    }
+#endif
+    for (; i < nCount; i++)
+    {
+        // In case the dynamics was actually 0-255 and not 0-65535 as
+        // expected, we want to make sure non-zero alpha will still
+        // be non-zero.
+        if (pSrc[i] > 0 && pSrc[i] < 257)
+            pabyImage[i] = 1;
+        else
+            pabyImage[i] = static_cast<GByte>((pSrc[i] * 255) / 65535);
+    }
+}
+
 /************************************************************************/
 /*                             IRasterIO()                              */
 /************************************************************************/
@@ -121,18 +169,8 @@ CPLErr GDALRescaledAlphaBand::IRasterIO(
                 return eErr;
 
             GByte *pabyImage = static_cast<GByte *>(pData) + j * nLineSpace;
-            GUInt16 *pSrc = static_cast<GUInt16 *>(pTemp);
-
-            for (int i = 0; i < nBufXSize; i++)
-            {
-                // In case the dynamics was actually 0-255 and not 0-65535 as
-                // expected, we want to make sure non-zero alpha will still
-                // be non-zero.
-                if (pSrc[i] > 0 && pSrc[i] < 257)
-                    pabyImage[i] = 1;
-                else
-                    pabyImage[i] = static_cast<GByte>((pSrc[i] * 255) / 65535);
-            }
+            RescaleAlphaLine(pabyImage, static_cast<const GUInt16 *>(pTemp),
+                             nBufXSize);
         }
         return CE_None;
     }
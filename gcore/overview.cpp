@@ -42,6 +42,7 @@
 #include <list>
 #include <memory>
 #include <mutex>
+#include <type_traits>
 #include <vector>
 
 #include "cpl_conv.h"
@@ -78,6 +79,39 @@
 // to avoid build issue on Windows x86
 #include "gdal_priv_templates.hpp"
 
+#ifdef USE_SSE2
+
+/************************************************************************/
+/*                      NearByteFactorTwoSSE2()                         */
+/************************************************************************/
+
+// Optimized implementation of nearest neighbour decimation by a factor of 2
+// on Byte, that is pDstScanline[i] = pSrcScanline[2 * i], by extracting the
+// even bytes of 32 source bytes and packing them into 16 output bytes.
+static int NearByteFactorTwoSSE2(int nDstXWidth,
+                                 const GByte *CPL_RESTRICT pSrcScanline,
+                                 GByte *CPL_RESTRICT pDstScanline)
+{
+    const auto lowByteMask = _mm_set1_epi16(0xFF);
+    int iDstPixel = 0;
+    for (; iDstPixel < nDstXWidth - 15; iDstPixel += 16)
+    {
+        const auto first =
+            _mm_and_si128(_mm_loadu_si128(reinterpret_cast<__m128i const *>(
+                              pSrcScanline + 2 * iDstPixel)),
+                          lowByteMask);
+        const auto second =
+            _mm_and_si128(_mm_loadu_si128(reinterpret_cast<__m128i const *>(
+                              pSrcScanline + 2 * iDstPixel + 16)),
+                          lowByteMask);
+        _mm_storeu_si128(reinterpret_cast<__m128i *>(pDstScanline + iDstPixel),
+                         _mm_packus_epi16(first, second));
+    }
+    return iDstPixel;
+}
+
+#endif
+
 /************************************************************************/
 /*                      GDALResampleChunk_Near()                        */
 /************************************************************************/
@@ -115,6 +149,7 @@ static CPLErr GDALResampleChunk_NearT(
     /* ==================================================================== */
     /*      Precompute inner loop constants.                                */
     /* ==================================================================== */
+    bool bSrcXSpacingIsTwo = true;
     for (int iDstPixel = nDstXOff; iDstPixel < nDstXOff2; ++iDstPixel)
     {
         int nSrcXOff = static_cast<int>(0.5 + iDstPixel * dfXRatioDstToSrc);
@@ -122,8 +157,24 @@ static CPLErr GDALResampleChunk_NearT(
             nSrcXOff = nChunkXOff;
 
         panSrcXOff[iDstPixel - nDstXOff] = nSrcXOff;
+        if (iDstPixel > nDstXOff &&
+            nSrcXOff != panSrcXOff[iDstPixel - nDstXOff - 1] + 2)
+            bSrcXSpacingIsTwo = false;
     }
 
+#ifdef USE_SSE2
+    // Number of destination pixels for which the source pixel and the one
+    // following it are within the chunk, so that they can be read by
+    // NearByteFactorTwoSSE2()
+    const int nDstXWidthFactorTwo =
+        bSrcXSpacingIsTwo
+            ? std::min(nDstXWidth,
+                       (nChunkXOff + nChunkXSize - panSrcXOff[0]) / 2)
+            : 0;
+#else
+    CPL_IGNORE_RET_VAL(bSrcXSpacingIsTwo);
+#endif
+
     /* ==================================================================== */
     /*      Loop over destination scanlines.                                */
     /* ==================================================================== */
@@ -144,7 +195,19 @@ static CPLErr GDALResampleChunk_NearT(
         /* --------------------------------------------------------------------
          */
         T *pDstScanline = pDstBuffer + (iDstLine - nDstYOff) * nDstXWidth;
-        for (int iDstPixel = 0; iDstPixel < nDstXWidth; ++iDstPixel)
+        int iDstPixel = 0;
+#ifdef USE_SSE2
+        if constexpr (std::is_same<T, GByte>::value)
+        {
+            if (nDstXWidthFactorTwo > 0)
+            {
+                iDstPixel = NearByteFactorTwoSSE2(nDstXWidthFactorTwo,
+                                                  pSrcScanline + panSrcXOff[0],
+                                                  pDstScanline);
+            }
+        }
+#endif
+        for (; iDstPixel < nDstXWidth; ++iDstPixel)
         {
             pDstScanline[iDstPixel] = pSrcScanline[panSrcXOff[iDstPixel]];
         }
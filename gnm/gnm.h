@@ -51,6 +51,7 @@ typedef int GNMDirection;  // We use int values in order to save them to the
 #define GNM_MD_FETCHEDGES "fetch_edge"
 #define GNM_MD_FETCHVERTEX "fetch_vertex"
 #define GNM_MD_NUM_PATHS "num_paths"
+#define GNM_MD_BIDIRECTIONAL "bidirectional"
 #define GNM_MD_EMITTER "emitter"
 
 // TODO: Constants for capabilities.
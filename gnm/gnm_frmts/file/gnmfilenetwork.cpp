@@ -221,7 +221,7 @@ CPLErr GNMFileNetwork::Delete()
     // check if folder empty
     char **papszFiles = VSIReadDir(m_soNetworkFullName);
     bool bIsEmpty = true;
-    for (int i = 0; papszFiles[i] != nullptr; ++i)
+    for (int i = 0; papszFiles != nullptr && papszFiles[i] != nullptr; ++i)
     {
         if (!(EQUAL(papszFiles[i], "..") || EQUAL(papszFiles[i], ".")))
         {
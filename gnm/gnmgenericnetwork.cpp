@@ -811,7 +811,11 @@ OGRLayer *GNMGenericNetwork::GetPath(GNMGFID nStartFID, GNMGFID nEndFID,
     {
         case GATDijkstraShortestPath:
         {
-            GNMPATH path = m_oGraph.DijkstraShortestPath(nStartFID, nEndFID);
+            GNMPATH path =
+                CPLFetchBool(papszOptions, GNM_MD_BIDIRECTIONAL, false)
+                    ? m_oGraph.BidirectionalDijkstraShortestPath(nStartFID,
+                                                                 nEndFID)
+                    : m_oGraph.DijkstraShortestPath(nStartFID, nEndFID);
 
             // fill features in result layer
             FillResultLayer(poResLayer, path, 1, bReturnVertices, bReturnEdges);
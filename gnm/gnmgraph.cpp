@@ -35,6 +35,97 @@
 #include <set>
 
 //! @cond Doxygen_Suppress
+
+namespace
+{
+
+// Priority queue of the vertices to see in
+// GNMGraph::DijkstraShortestPathTree(), implemented as a 4-ary min-heap, that
+// is shallower than a binary heap and whose children of a node are adjacent
+// in memory. Vertices are returned by ascending mark, and in insertion order
+// for equal marks.
+class GNMVertexQueue
+{
+    struct Item
+    {
+        double dfMark;
+        size_t nOrder;
+        GNMGFID nVertexFID;
+    };
+
+    std::vector<Item> m_aoItems{};
+    size_t m_nInsertions = 0;
+
+    static bool IsBefore(const Item &a, const Item &b)
+    {
+        return a.dfMark < b.dfMark ||
+               (a.dfMark == b.dfMark && a.nOrder < b.nOrder);
+    }
+
+  public:
+    bool empty() const
+    {
+        return m_aoItems.empty();
+    }
+
+    // Mark of the first vertex of the queue
+    double top() const
+    {
+        return m_aoItems[0].dfMark;
+    }
+
+    void push(double dfMark, GNMGFID nVertexFID)
+    {
+        const Item oItem = {dfMark, m_nInsertions++, nVertexFID};
+        size_t i = m_aoItems.size();
+        m_aoItems.push_back(oItem);
+        while (i > 0)
+        {
+            const size_t iParent = (i - 1) / 4;
+            if (!IsBefore(oItem, m_aoItems[iParent]))
+                break;
+            m_aoItems[i] = m_aoItems[iParent];
+            i = iParent;
+        }
+        m_aoItems[i] = oItem;
+    }
+
+    // Remove the first vertex of the queue
+    void pop(double &dfMark, GNMGFID &nVertexFID)
+    {
+        dfMark = m_aoItems[0].dfMark;
+        nVertexFID = m_aoItems[0].nVertexFID;
+
+        const Item oLast = m_aoItems.back();
+        m_aoItems.pop_back();
+        const size_t nSize = m_aoItems.size();
+        if (nSize == 0)
+            return;
+
+        size_t i = 0;
+        while (true)
+        {
+            const size_t iFirstChild = 4 * i + 1;
+            if (iFirstChild >= nSize)
+                break;
+            const size_t iLastChild = std::min(iFirstChild + 4, nSize);
+            size_t iMinChild = iFirstChild;
+            for (size_t iChild = iFirstChild + 1; iChild < iLastChild; ++iChild)
+            {
+                if (IsBefore(m_aoItems[iChild], m_aoItems[iMinChild]))
+                    iMinChild = iChild;
+            }
+            if (!IsBefore(m_aoItems[iMinChild], oLast))
+                break;
+            m_aoItems[i] = m_aoItems[iMinChild];
+            i = iMinChild;
+        }
+        m_aoItems[i] = oLast;
+    }
+};
+
+}  // namespace
+
 GNMGraph::GNMGraph()
 {
 }
@@ -108,10 +199,13 @@ void GNMGraph::AddEdge(GNMGFID nConFID, GNMGFID nSrcFID, GNMGFID nTgtFID,
     {
         itSrs->second.anOutEdgeFIDs.push_back(nConFID);
         itTgt->second.anOutEdgeFIDs.push_back(nConFID);
+        itSrs->second.anInEdgeFIDs.push_back(nConFID);
+        itTgt->second.anInEdgeFIDs.push_back(nConFID);
     }
     else
     {
         itSrs->second.anOutEdgeFIDs.push_back(nConFID);
+        itTgt->second.anInEdgeFIDs.push_back(nConFID);
     }
 }
 
@@ -119,13 +213,17 @@ void GNMGraph::DeleteEdge(GNMGFID nConFID)
 {
     m_mstEdges.erase(nConFID);
 
-    // remove edge from all vertices anOutEdgeFIDs
+    // remove edge from all vertices anOutEdgeFIDs and anInEdgeFIDs
     for (auto &it : m_mstVertices)
     {
         it.second.anOutEdgeFIDs.erase(
             std::remove(it.second.anOutEdgeFIDs.begin(),
                         it.second.anOutEdgeFIDs.end(), nConFID),
             it.second.anOutEdgeFIDs.end());
+        it.second.anInEdgeFIDs.erase(std::remove(it.second.anInEdgeFIDs.begin(),
+                                                 it.second.anInEdgeFIDs.end(),
+                                                 nConFID),
+                                     it.second.anInEdgeFIDs.end());
     }
 }
 
@@ -186,7 +284,7 @@ GNMGraph::DijkstraShortestPath(GNMGFID nStartFID, GNMGFID nEndFID,
                                const std::map<GNMGFID, GNMStdEdge> &mstEdges)
 {
     std::map<GNMGFID, GNMGFID> mnShortestTree;
-    DijkstraShortestPathTree(nStartFID, mstEdges, mnShortestTree);
+    DijkstraShortestPathTree(nStartFID, mstEdges, mnShortestTree, nEndFID);
 
     // We search for a path in the resulting tree, starting from end point to
     // start point.
@@ -244,6 +342,136 @@ GNMPATH GNMGraph::DijkstraShortestPath(GNMGFID nStartFID, GNMGFID nEndFID)
     return DijkstraShortestPath(nStartFID, nEndFID, m_mstEdges);
 }
 
+GNMPATH GNMGraph::BidirectionalDijkstraShortestPath(GNMGFID nStartFID,
+                                                    GNMGFID nEndFID)
+{
+    GNMPATH aoShortestPath;
+    if (nStartFID == nEndFID)
+    {
+        aoShortestPath.push_back(std::make_pair(nStartFID, -1));
+        return aoShortestPath;
+    }
+
+    // The end vertex can not be reached if it is blocked, as in the forward
+    // search.
+    if (CheckVertexBlocked(nEndFID))
+        return aoShortestPath;
+
+    // Index 0 is for the forward search from the start vertex and index 1
+    // for the backward search from the end vertex. The path trees map a
+    // vertex to the edge leading to it from the start (resp. end) vertex.
+    std::map<GNMGFID, double> amMarks[2];
+    std::map<GNMGFID, GNMGFID> amnPathTree[2];
+    std::set<GNMGFID> asnSeen[2];
+    GNMVertexQueue ato_see[2];
+
+    amMarks[0][nStartFID] = 0.0;
+    amMarks[1][nEndFID] = 0.0;
+    ato_see[0].push(0.0, nStartFID);
+    ato_see[1].push(0.0, nEndFID);
+
+    // Cost of the best path found so far, and the vertex where the two
+    // searches meet on it.
+    double dfBestCost = std::numeric_limits<double>::infinity();
+    GNMGFID nMeetingVertId = -1;
+
+    while (!ato_see[0].empty() && !ato_see[1].empty())
+    {
+        // No path through the vertices still to see can be better than the
+        // one already found.
+        if (ato_see[0].top() + ato_see[1].top() >= dfBestCost)
+            break;
+
+        // Continue with the search which frontier is the closest.
+        const int iDir = ato_see[0].top() <= ato_see[1].top() ? 0 : 1;
+
+        double dfCurrentVertMark;
+        GNMGFID nCurrentVertId;
+        ato_see[iDir].pop(dfCurrentVertMark, nCurrentVertId);
+
+        // Skip the vertices that have already been seen with a lower mark.
+        if (!asnSeen[iDir].insert(nCurrentVertId).second)
+            continue;
+
+        // The backward search goes along the incoming edges of the vertices.
+        LPGNMCONSTVECTOR panEdgeIds = iDir == 0 ? GetOutEdges(nCurrentVertId)
+                                                : GetInEdges(nCurrentVertId);
+        if (nullptr == panEdgeIds)
+            continue;
+
+        for (size_t i = 0; i < panEdgeIds->size(); ++i)
+        {
+            const GNMGFID nCurrentEdgeId = panEdgeIds->operator[](i);
+
+            const auto ite = m_mstEdges.find(nCurrentEdgeId);
+            if (ite == m_mstEdges.end() || ite->second.bIsBlocked)
+                continue;
+
+            const GNMGFID nTargetVertId =
+                GetOppositVertex(nCurrentEdgeId, nCurrentVertId);
+
+            // The start vertex is never checked for blocking by the forward
+            // search, so do the same in the backward one.
+            if (asnSeen[iDir].find(nTargetVertId) != asnSeen[iDir].end() ||
+                (nTargetVertId != nStartFID &&
+                 CheckVertexBlocked(nTargetVertId)))
+                continue;
+
+            // As in DijkstraShortestPathTree(), the direct cost is used in
+            // any direction.
+            const double dfNewVertexMark =
+                dfCurrentVertMark + ite->second.dfDirCost;
+
+            std::map<GNMGFID, double>::iterator itMark =
+                amMarks[iDir].find(nTargetVertId);
+            if (itMark != amMarks[iDir].end() &&
+                !(dfNewVertexMark < itMark->second))
+                continue;
+
+            amMarks[iDir][nTargetVertId] = dfNewVertexMark;
+            amnPathTree[iDir][nTargetVertId] = nCurrentEdgeId;
+            ato_see[iDir].push(dfNewVertexMark, nTargetVertId);
+
+            // Check if the vertex has already been reached by the other
+            // search, and whether this gives a better path.
+            std::map<GNMGFID, double>::const_iterator itOtherMark =
+                amMarks[1 - iDir].find(nTargetVertId);
+            if (itOtherMark != amMarks[1 - iDir].end() &&
+                dfNewVertexMark + itOtherMark->second < dfBestCost)
+            {
+                dfBestCost = dfNewVertexMark + itOtherMark->second;
+                nMeetingVertId = nTargetVertId;
+            }
+        }
+    }
+
+    if (nMeetingVertId == -1)
+        return aoShortestPath;
+
+    // Go back from the meeting vertex to the start vertex, and then revert
+    // this part of the path.
+    GNMGFID nNextVertexId = nMeetingVertId;
+    while (nNextVertexId != nStartFID)
+    {
+        const GNMGFID nEdgeId = amnPathTree[0][nNextVertexId];
+        aoShortestPath.push_back(std::make_pair(nNextVertexId, nEdgeId));
+        nNextVertexId = GetOppositVertex(nEdgeId, nNextVertexId);
+    }
+    aoShortestPath.push_back(std::make_pair(nStartFID, -1));
+    std::reverse(aoShortestPath.begin(), aoShortestPath.end());
+
+    // Then go forward from the meeting vertex to the end vertex.
+    nNextVertexId = nMeetingVertId;
+    while (nNextVertexId != nEndFID)
+    {
+        const GNMGFID nEdgeId = amnPathTree[1][nNextVertexId];
+        nNextVertexId = GetOppositVertex(nEdgeId, nNextVertexId);
+        aoShortestPath.push_back(std::make_pair(nNextVertexId, nEdgeId));
+    }
+
+    return aoShortestPath;
+}
+
 std::vector<GNMPATH> GNMGraph::KShortestPaths(GNMGFID nStartFID,
                                               GNMGFID nEndFID, size_t nK)
 {
@@ -456,7 +684,7 @@ void GNMGraph::Clear()
 
 void GNMGraph::DijkstraShortestPathTree(
     GNMGFID nFID, const std::map<GNMGFID, GNMStdEdge> &mstEdges,
-    std::map<GNMGFID, GNMGFID> &mnPathTree)
+    std::map<GNMGFID, GNMGFID> &mnPathTree, GNMGFID nEndFID)
 {
     // Initialize all vertices in graph with infinity mark.
     double dfInfinity = std::numeric_limits<double>::infinity();
@@ -474,11 +702,10 @@ void GNMGraph::DijkstraShortestPathTree(
     // Initialize all vertices as unseen (there are no seen vertices).
     std::set<GNMGFID> snSeen;
 
-    // We use multimap to maintain the ascending order of costs and because
-    // there can be different vertices with the equal cost.
-    std::multimap<double, GNMGFID> to_see;
-    std::multimap<double, GNMGFID>::iterator it;
-    to_see.insert(std::pair<double, GNMGFID>(0.0, nFID));
+    // A vertex may be several times in the queue, with decreasing marks, if
+    // its mark has been updated before it has been seen.
+    GNMVertexQueue to_see;
+    to_see.push(0.0, nFID);
     LPGNMCONSTVECTOR panOutcomeEdgeId;
 
     size_t i;
@@ -490,13 +717,16 @@ void GNMGraph::DijkstraShortestPathTree(
     while (!to_see.empty())
     {
         // We must see vertices with minimal costs at first.
-        // In multimap the first cost is the minimal.
-        it = to_see.begin();
+        to_see.pop(dfCurrentVertMark, nCurrentVertId);
 
-        nCurrentVertId = it->second;
-        dfCurrentVertMark = it->first;
-        snSeen.insert(it->second);
-        to_see.erase(it);
+        // Skip the vertices that have already been seen with a lower mark.
+        if (!snSeen.insert(nCurrentVertId).second)
+            continue;
+
+        // The first time the end vertex is seen, its mark is the minimal one,
+        // so the path to it in the tree will not change anymore.
+        if (nCurrentVertId == nEndFID)
+            break;
 
         // For all neighbours for the current vertex.
         panOutcomeEdgeId = GetOutEdges(nCurrentVertId);
@@ -531,10 +761,7 @@ void GNMGraph::DijkstraShortestPathTree(
                 mMarks[nTargetVertId] = dfNewVertexMark;
                 mnPathTree[nTargetVertId] = nCurrentEdgeId;
 
-                // The vertex with minimal cost will be inserted to the
-                // beginning.
-                to_see.insert(
-                    std::pair<double, GNMGFID>(dfNewVertexMark, nTargetVertId));
+                to_see.push(dfNewVertexMark, nTargetVertId);
             }
         }
     }
@@ -549,6 +776,15 @@ LPGNMCONSTVECTOR GNMGraph::GetOutEdges(GNMGFID nFID) const
     return nullptr;
 }
 
+LPGNMCONSTVECTOR GNMGraph::GetInEdges(GNMGFID nFID) const
+{
+    std::map<GNMGFID, GNMStdVertex>::const_iterator it =
+        m_mstVertices.find(nFID);
+    if (it != m_mstVertices.end())
+        return &it->second.anInEdgeFIDs;
+    return nullptr;
+}
+
 GNMGFID GNMGraph::GetOppositVertex(GNMGFID nEdgeFID, GNMGFID nVertexFID) const
 {
     std::map<GNMGFID, GNMStdEdge>::const_iterator it =
@@ -70,6 +70,7 @@ struct GNMStdEdge
 struct GNMStdVertex
 {
     GNMVECTOR anOutEdgeFIDs; /**< TODO */
+    GNMVECTOR anInEdgeFIDs;  /**< Edges leading to the vertex */
     bool bIsBlocked;         /**< Whether the vertex is blocked */
 };
 
@@ -173,6 +174,26 @@ class CPL_DLL GNMGraph
      */
     virtual GNMPATH DijkstraShortestPath(GNMGFID nStartFID, GNMGFID nEndFID);
 
+    /**
+     * @brief A bidirectional variant of the Dijkstra shortest path algorithm.
+     *
+     * Returns the best path between nStartFID and nEndFID features, like
+     * @see DijkstraShortestPath, but searches alternately forward from the
+     * start vertex and backward from the end vertex, until the two searches
+     * meet. This usually sees far fewer vertices than a single forward
+     * search. If there are several best paths, the one returned may differ
+     * from the one returned by DijkstraShortestPath.
+     *
+     * @param nStartFID Start identificator
+     * @param nEndFID End identificator
+     * @return an array of best path included identificator of vertices and
+     * edges
+     *
+     * @since GDAL 3.10
+     */
+    virtual GNMPATH BidirectionalDijkstraShortestPath(GNMGFID nStartFID,
+                                                      GNMGFID nEndFID);
+
     /**
      * @brief An implementation of KShortest paths algorithm.
      *
@@ -230,17 +251,21 @@ class CPL_DLL GNMGraph
      * is the edge identificator, which is the best way to the current vertex.
      * The identificator to the start vertex is -1. If the vertex is isolated
      * the returned map will be empty.
+     * @param nEndFID - Vertex identificator at which the tree building can
+     * stop, once the best path to it is known, or -1 to build the whole tree.
+     * In the former case, only the path to nEndFID is guaranteed to be the
+     * best one in the resulting tree.
      */
-    virtual void
-    DijkstraShortestPathTree(GNMGFID nFID,
-                             const std::map<GNMGFID, GNMStdEdge> &mstEdges,
-                             std::map<GNMGFID, GNMGFID> &mnPathTree);
+    virtual void DijkstraShortestPathTree(
+        GNMGFID nFID, const std::map<GNMGFID, GNMStdEdge> &mstEdges,
+        std::map<GNMGFID, GNMGFID> &mnPathTree, GNMGFID nEndFID = -1);
     /** DijkstraShortestPath */
     virtual GNMPATH
     DijkstraShortestPath(GNMGFID nStartFID, GNMGFID nEndFID,
                          const std::map<GNMGFID, GNMStdEdge> &mstEdges);
     //! @cond Doxygen_Suppress
     virtual LPGNMCONSTVECTOR GetOutEdges(GNMGFID nFID) const;
+    virtual LPGNMCONSTVECTOR GetInEdges(GNMGFID nFID) const;
     virtual GNMGFID GetOppositVertex(GNMGFID nEdgeFID,
                                      GNMGFID nVertexFID) const;
     virtual void TraceTargets(std::queue<GNMGFID> &vertexQueue,